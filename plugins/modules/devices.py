@@ -226,7 +226,7 @@ def check_idempotency(module, init_props, attributes, msg):
         init_props = str_to_dict(init_props, attributes)
 
     for attr, val in attributes.items():
-        if attr in init_props.keys() and str(init_props[attr]) == str(val):
+        if attr in init_props and str(init_props[attr]) == str(val):
             ignore_attributes.append(attr)
     for attr in ignore_attributes:
         if attr in attributes:
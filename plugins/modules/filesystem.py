@@ -276,7 +276,7 @@ def compare_attrs(module):
 
     line2 = lines2[1].split()
     for it in range(8):
-        if fs_attrs[it] in current_attributes.keys() and current_attributes[fs_attrs[it]] != "--":
+        if fs_attrs[it] in current_attributes and current_attributes[fs_attrs[it]] != "--":
             continue
         current_attributes[fs_attrs[it]] = line2[it]
 
@@ -297,7 +297,7 @@ def compare_attrs(module):
                 attr_key = attr_key[1:]
             if attr_val[-1] == ")":
                 attr_val = attr_val[:-1]
-            if attr_key in mapped_key.keys():
+            if attr_key in mapped_key:
                 attr_key = mapped_key[attr_key]
             current_attributes[attr_key] = attr_val
 
@@ -353,7 +353,7 @@ def compare_attrs(module):
                 block_size = int(current_attributes["block size"]) // 1024
                 val = str(int(val) * block_size * 512)
 
-            if attr not in current_attributes.keys() or val not in current_attributes[attr].split(','):
+            if attr not in current_attributes or val not in current_attributes[attr].split(','):
                 updated_attrs.append(f"{attr}={val}")
 
     if check_other_perms == 4 and len(updated_attrs) == 0:
@@ -371,7 +371,7 @@ def parse_stdout(stdout):
 
             else:
                 if curr_key == "":
-                    if "MISC" not in parsed_output.keys():
+                    if "MISC" not in parsed_output:
                         parsed_output["MISC"] = line
                     else:
                         parsed_output["MISC"] += " " + line
@@ -402,7 +402,7 @@ def parse_MCP_info(stdout):
                 val = ''.join(val.split('\"'))
             resource_info[id] = val
 
-    if current_resource not in parsed_info.keys():
+    if current_resource not in parsed_info:
         parsed_info[current_resource] = resource_info
 
     return parsed_info
@@ -784,7 +784,7 @@ def check_rootvg(module, vios):
         if copy == 1:
             nb_lp += 1
 
-        if hdisk in hdisk_dict.keys():
+        if hdisk in hdisk_dict:
             if hdisk_dict[hdisk] != copy:
                 msg = "rootvg data structure is not compatible with an "\
                       "alt_disk_copy operation (2 copies on the same disk)"
@@ -794,7 +794,7 @@ def check_rootvg(module, vios):
         else:
             hdisk_dict[hdisk] = copy
 
-        if copy not in copy_dict.keys():
+        if copy not in copy_dict:
             if hdisk in copy_dict.values():
                 msg = "rootvg data structure is not compatible with an alt_disk_copy operation"
                 results['meta'][vios]['messages'].append(msg)
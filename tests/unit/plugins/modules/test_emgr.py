@@ -16,16 +16,17 @@ from .common.utils import (
 
 
 class TestEmgrListOutput(unittest.TestCase):
-    def setUp(self):
-        # sample emgr output
+    @classmethod
+    def setUpClass(cls):
+        # sample emgr output, read once for the whole class
         with open(emgr_output_path1, "r") as f:
-            self.emgr_output1 = f.read().strip()
+            cls.emgr_output1 = f.read().strip()
         with open(emgr_output_path2, "r") as f:
-            self.emgr_output2 = f.read().strip()
+            cls.emgr_output2 = f.read().strip()
         with open(emgr_output_path3, "r") as f:
-            self.emgr_output3 = f.read().strip()
+            cls.emgr_output3 = f.read().strip()
         with open(emgr_output_path4, "r") as f:
-            self.emgr_output4 = f.read().strip()
+            cls.emgr_output4 = f.read().strip()
 
     def test_success_emgr_list_output_with_ifix(self):
         ifix_details = emgr.parse_ifix_details(self.emgr_output1)